@@ -17,27 +17,56 @@ Key behaviors:
 - Recursively walks the provided root directory while skipping zero-byte files,
   names containing "part", temporary/hidden files, and non-target media types
   such as audio or video.
-- Normalizes and deduplicates matches using case-insensitive paths and a
-  name/size fingerprint to avoid repeats.
+- Normalizes and deduplicates matches using case-insensitive paths and file
+  contents: files are bucketed by size and only same-size files are hashed
+  (BLAKE3 when the ``blake3`` package is installed, BLAKE2b otherwise).
 - Produces two structured views: a concise categorized list by inferred type
   and a detailed list with absolute paths and metadata.
-- Supports exporting results to JSON or structured text for downstream tools.
+- Supports exporting results to JSON or structured text for downstream tools
+  (JSON is encoded with ``orjson`` when that package is installed).
 """
 from __future__ import annotations
 
 import argparse
+import hashlib
+import heapq
 import json
 import os
+import pickle
 import re
 import shutil
-from fnmatch import fnmatchcase
-from dataclasses import dataclass, asdict
+import stat
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from fnmatch import translate
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Dict, Iterable, List, Sequence, Set
-
-
-TARGET_EXTENSIONS: Set[str] = {
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Sequence, Set, TextIO, Tuple
+
+# Content hashing for deduplication: BLAKE3 when installed, otherwise the
+# standard library's BLAKE2b.
+try:
+    from blake3 import blake3 as new_hasher
+except ImportError:
+    new_hasher = hashlib.blake2b
+# POSIX only; reflink copies are skipped without it.
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+# JSON export: orjson when installed, otherwise the streaming stdlib writer.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+TARGET_EXTENSIONS: FrozenSet[str] = frozenset({
     ".pdf",
     ".epub",
     ".docx",
@@ -48,13 +77,50 @@ TARGET_EXTENSIONS: Set[str] = {
     ".azw3",
     ".rtf",
     ".md",
+})
+VIDEO_EXTENSIONS: FrozenSet[str] = frozenset({".mp4", ".mkv", ".avi", ".mov", ".wmv"})
+AUDIO_EXTENSIONS: FrozenSet[str] = frozenset({".mp3", ".flac", ".aac", ".ogg", ".wav"})
+TEMP_SUFFIXES: FrozenSet[str] = frozenset({"~", ".tmp", ".temp"})
+EXT_CATEGORY: Dict[str, str] = {
+    ".pdf": "pdf",
+    ".epub": "ebook",
+    ".mobi": "ebook",
+    ".azw": "ebook",
+    ".azw3": "ebook",
+    ".doc": "document",
+    ".docx": "document",
+    ".rtf": "document",
+    ".txt": "text",
+    ".md": "text",
 }
-VIDEO_EXTENSIONS: Set[str] = {".mp4", ".mkv", ".avi", ".mov", ".wmv"}
-AUDIO_EXTENSIONS: Set[str] = {".mp3", ".flac", ".aac", ".ogg", ".wav"}
-TEMP_SUFFIXES: Set[str] = {"~", ".tmp", ".temp"}
-
-
-@dataclass
+# Precomputed forms of the filters above for the per-file hot path.
+MEDIA_EXTENSIONS: FrozenSet[str] = VIDEO_EXTENSIONS | AUDIO_EXTENSIONS
+TEMP_SUFFIX_TUPLE: Tuple[str, ...] = tuple(TEMP_SUFFIXES)
+DEFAULT_SCAN_THREADS = min(32, (os.cpu_count() or 1) * 4)
+# DirEntry.inode() is free on POSIX but costs a stat call on Windows.
+SORT_BY_INODE = os.name != "nt"
+# Read size for content hashing.
+HASH_CHUNK_SIZE = 1 << 20
+# Files above this size are first compared on three sampled windows.
+SAMPLE_THRESHOLD = 196 * 1024
+SAMPLE_WINDOW = 64 * 1024
+# Opt-in scan cache (--scan-cache): entries unused for a day expire, and the
+# least recently used beyond the cap are evicted (never those used this run).
+SCAN_CACHE_PATH = Path.home() / ".cache" / "library_scanner" / "scan.cache"
+SCAN_CACHE_VERSION = 3
+# The cache file starts with a BLAKE2b checksum of the pickled body.
+SCAN_CACHE_CHECKSUM_SIZE = 32
+SCAN_CACHE_TTL_SECONDS = 24 * 60 * 60
+SCAN_CACHE_MAX_ENTRIES = 2000
+# Linux FICLONE ioctl for copy-on-write clones during staged copies.
+FICLONE = 0x40049409
+# Write buffer for exported files, so large listings go out in few syscalls.
+OUTPUT_BUFFER_SIZE = 1 << 20
+# Staged copies kept in flight at once.
+COPY_THREADS = 8
+
+
+@dataclass(slots=True)
 class FileRecord:
     path: str
     name: str
@@ -63,138 +129,514 @@ class FileRecord:
     category: str
 
     def to_dict(self) -> Dict[str, str | int]:
-        return asdict(self)
+        return {
+            "path": self.path,
+            "name": self.name,
+            "size": self.size,
+            "extension": self.extension,
+            "category": self.category,
+        }
+
+
+# Matching files and (inode, path) subdirectories found in one directory.
+ScanResult = Tuple[List[FileRecord], List[Tuple[int, str]]]
+# Candidate files (entry, extension) that passed the name filters, plus subdirectories.
+DirectoryListing = Tuple[List[Tuple[os.DirEntry, str]], List[Tuple[int, str]]]
+# A DirectoryListing with entries reduced to (name, extension) for pickling.
+CachedListing = Tuple[List[Tuple[str, str]], List[Tuple[int, str]]]
+
+
+@dataclass
+class ScanCache:
+    """Listings and content hashes reused across runs (see ``--scan-cache``).
+
+    ``directories`` maps a directory path to ``(last_used, mtime_ns,
+    allowed_ext, listing)``; ``digests`` maps ``(path, size, mtime_ns,
+    sampled)`` to ``(last_used, digest)``.
+    """
+
+    directories: Dict[str, Tuple[float, int, FrozenSet[str], CachedListing]] = field(
+        default_factory=dict
+    )
+    digests: Dict[Tuple[str, int, int, bool], Tuple[float, bytes]] = field(default_factory=dict)
+    # Entries used at or after this time were touched by the current run.
+    opened_at: float = field(default_factory=time.time)
 
 
 def infer_category(extension: str) -> str:
-    if extension in {".pdf"}:
-        return "pdf"
-    if extension in {".epub", ".mobi", ".azw", ".azw3"}:
-        return "ebook"
-    if extension in {".doc", ".docx", ".rtf"}:
-        return "document"
-    if extension in {".txt", ".md"}:
-        return "text"
-    return extension.lstrip(".") or "other"
-
-
-def should_skip(name: str, extension: str) -> bool:
+    return EXT_CATEGORY.get(extension) or extension.lstrip(".") or "other"
+
+
+def should_skip(name: str) -> bool:
     lower_name = name.lower()
-    if lower_name.startswith("."):
-        return True
-    if "part" in lower_name:
-        return True
-    if any(lower_name.endswith(suffix) for suffix in TEMP_SUFFIXES):
-        return True
-    if extension in VIDEO_EXTENSIONS or extension in AUDIO_EXTENSIONS:
-        return True
-    return False
+    return (
+        name.startswith(".")
+        or "part" in lower_name
+        or lower_name.endswith(TEMP_SUFFIX_TUPLE)
+    )
 
 
-def collect_candidates(
-    root: Path,
-    include_ext: Set[str] | None,
-    exclude_ext: Set[str],
-    skip_media: bool = True,
-) -> List[FileRecord]:
+def list_directory(directory: str, allowed_ext: FrozenSet[str]) -> DirectoryListing | None:
+    """List one directory's candidate files and subdirectories to visit.
+
+    ``allowed_ext`` is the final extension filter, with excluded and (when
+    skipped) media extensions already removed. Returns None when the directory
+    cannot be read.
+    """
+    subdirs: List[Tuple[int, str]] = []
+    candidates: List[Tuple[os.DirEntry, str]] = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                filename = entry.name
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    # Prune hidden and partial directories before they are queued
+                    # so their subtrees are never opened or listed.
+                    lower_dirname = filename.lower()
+                    if not lower_dirname.startswith(".") and "part" not in lower_dirname:
+                        subdirs.append((entry.inode() if SORT_BY_INODE else 0, entry.path))
+                    continue
+
+                # Same rule as Path.suffix without building a path object.
+                dot = filename.rfind(".")
+                extension = filename[dot:].lower() if 0 < dot < len(filename) - 1 else ""
+                # One set lookup rejects most files before the name checks run.
+                if extension not in allowed_ext or should_skip(filename):
+                    continue
+                candidates.append((entry, extension))
+    except OSError:
+        return None
+
+    if SORT_BY_INODE:
+        # Stat files in inode-table order to keep metadata reads sequential.
+        candidates.sort(key=lambda candidate: candidate[0].inode())
+    return candidates, subdirs
+
+
+def make_record(path: str, name: str, extension: str, st: os.stat_result) -> FileRecord | None:
+    """Build the record for a regular, non-empty file, or None to skip it."""
+    if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+        return None
+    return FileRecord(
+        path=path,
+        name=name,
+        size=st.st_size,
+        # Interned so records share one string per extension and category.
+        extension=sys.intern(extension),
+        category=sys.intern(infer_category(extension)),
+    )
+
+
+def stat_candidates(candidates: List[Tuple[os.DirEntry, str]]) -> List[FileRecord]:
+    """Stat listed candidates and keep the regular, non-empty files."""
     records: List[FileRecord] = []
-    include = {ext.lower() for ext in include_ext} if include_ext else None
-    exclude = {ext.lower() for ext in exclude_ext}
+    for entry, normalized_ext in candidates:
+        # Size is read only after every cheaper filter has passed. The lstat
+        # result is cached on the entry (and comes straight from the listing on
+        # Windows); only symlinks pay a second stat to reach their target, and
+        # are recorded under the target's path like the former Path.resolve().
+        path = entry.path
+        try:
+            st = entry.stat(follow_symlinks=False)
+            if stat.S_ISLNK(st.st_mode):
+                st = entry.stat()
+                path = os.path.realpath(path)
+        except OSError:
+            continue
+        record = make_record(path, entry.name, normalized_ext, st)
+        if record is not None:
+            records.append(record)
+    return records
 
-    for current_root, dirs, files in os.walk(root):
-        # Skip hidden directories early to avoid unnecessary traversal
-        dirs[:] = [d for d in dirs if not d.startswith(".") and "part" not in d.lower()]
 
-        for filename in files:
-            extension = Path(filename).suffix.lower()
-            if should_skip(filename, extension):
-                continue
-            if skip_media and (extension in VIDEO_EXTENSIONS or extension in AUDIO_EXTENSIONS):
-                continue
+def scan_directory(directory: str, allowed_ext: FrozenSet[str]) -> ScanResult:
+    """List one directory, returning its matching files and subdirectories to visit."""
+    listing = list_directory(directory, allowed_ext)
+    if listing is None:
+        return [], []
+    candidates, subdirs = listing
+    return stat_candidates(candidates), subdirs
+
+
+def scan_parallel(
+    root: str,
+    scan: Callable[[str], ScanResult],
+    threads: int,
+) -> Dict[str, ScanResult]:
+    """Scan every directory under root on a thread pool, keyed by directory path."""
+    results: Dict[str, ScanResult] = {}
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        pending: Dict[Future, str] = {executor.submit(scan, root): root}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                directory = pending.pop(future)
+                result = future.result()
+                results[directory] = result
+                for _, subdir in result[1]:
+                    pending[executor.submit(scan, subdir)] = subdir
+    return results
+
+
+def matches_shape(value: object, types: Tuple[type, ...]) -> bool:
+    """True if value is a tuple whose items are instances of types, in order."""
+    return (
+        isinstance(value, tuple)
+        and len(value) == len(types)
+        and all(isinstance(item, kind) for item, kind in zip(value, types))
+    )
 
-            normalized_ext = extension
-            if include is not None and normalized_ext not in include:
-                continue
-            if include is None and normalized_ext not in TARGET_EXTENSIONS:
-                continue
-            if normalized_ext in exclude:
-                continue
 
-            absolute_path = Path(current_root, filename)
+def is_valid_cache(directories: object, digests: object) -> bool:
+    """Check every loaded entry has the layout ScanCache documents."""
+    if not isinstance(directories, dict) or not isinstance(digests, dict):
+        return False
+    for directory, entry in directories.items():
+        if not isinstance(directory, str) or not matches_shape(entry, (float, int, frozenset, tuple)):
+            return False
+        listing = entry[3]
+        if not matches_shape(listing, (list, list)):
+            return False
+        names, subdirs = listing
+        # Paths end up in os.stat/os.scandir, which reject embedded NULs.
+        if not all(matches_shape(item, (str, str)) and "\0" not in item[0] for item in names):
+            return False
+        if not all(matches_shape(item, (int, str)) and "\0" not in item[1] for item in subdirs):
+            return False
+    return all(
+        matches_shape(key, (str, int, int, bool)) and matches_shape(entry, (float, bytes))
+        for key, entry in digests.items()
+    )
+
+
+def load_scan_cache(path: Path) -> ScanCache:
+    """Load a scan cache, starting fresh if it is missing, stale, or unreadable."""
+    try:
+        data = path.read_bytes()
+        checksum, body = data[:SCAN_CACHE_CHECKSUM_SIZE], data[SCAN_CACHE_CHECKSUM_SIZE:]
+        # Bit rot can unpickle into well-formed but wrong listings, so the body
+        # must match its checksum before it is trusted at all.
+        if hashlib.blake2b(body, digest_size=SCAN_CACHE_CHECKSUM_SIZE).digest() != checksum:
+            return ScanCache()
+        version, directories, digests = pickle.loads(body)
+    except Exception:
+        # A damaged pickle can fail in many ways (MemoryError, OverflowError,
+        # import errors, ...); any of them just means starting over.
+        return ScanCache()
+    if version != SCAN_CACHE_VERSION or not is_valid_cache(directories, digests):
+        return ScanCache()
+    return ScanCache(directories=directories, digests=digests)
+
+
+def prune_cache_entries(entries: Dict, now: float, opened_at: float) -> Dict:
+    """Drop entries unused for the TTL, then the least recently used beyond the cap.
+
+    Entries used by the current run are always kept, so a tree larger than the
+    cap does not evict what the next run will reuse.
+    """
+    fresh = [
+        (key, value)
+        for key, value in entries.items()
+        if now - value[0] < SCAN_CACHE_TTL_SECONDS
+    ]
+    in_use = sum(1 for _, value in fresh if value[0] >= opened_at)
+    limit = max(SCAN_CACHE_MAX_ENTRIES, in_use)
+    if len(fresh) > limit:
+        fresh.sort(key=lambda item: item[1][0])
+        fresh = fresh[-limit:]
+    return dict(fresh)
+
+
+def save_scan_cache(cache: ScanCache, path: Path) -> None:
+    now = time.time()
+    payload = (
+        SCAN_CACHE_VERSION,
+        prune_cache_entries(cache.directories, now, cache.opened_at),
+        prune_cache_entries(cache.digests, now, cache.opened_at),
+    )
+    body = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+    checksum = hashlib.blake2b(body, digest_size=SCAN_CACHE_CHECKSUM_SIZE).digest()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write a temp file beside the cache and rename it into place, so
+        # concurrent or interrupted runs never leave a half-written cache.
+        fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(checksum)
+                handle.write(body)
+            os.replace(temp_name, path)
+        finally:
+            if os.path.exists(temp_name):
+                os.unlink(temp_name)
+    except OSError as exc:
+        print(f"Warning: could not write scan cache {path}: {exc}")
+
+
+def cached_scan(directory: str, allowed_ext: FrozenSet[str], cache: ScanCache) -> ScanResult:
+    """Reuse a directory's cached listing while its mtime and filters are unchanged.
+
+    A directory's mtime only moves when entries are added, removed, or renamed,
+    so only the names are cached: files can change size or type in place, so
+    every candidate is stat'ed again, and subdirectories are still visited (and
+    checked) individually.
+    """
+    try:
+        mtime_ns = os.stat(directory).st_mtime_ns
+    except OSError:
+        return scan_directory(directory, allowed_ext)
+    now = time.time()
+    cached = cache.directories.get(directory)
+    if (
+        cached is not None
+        and cached[1] == mtime_ns
+        and cached[2] == allowed_ext
+        and now - cached[0] < SCAN_CACHE_TTL_SECONDS
+    ):
+        names, subdirs = cached[3]
+        records: List[FileRecord] = []
+        for name, extension in names:
+            path = os.path.join(directory, name)
             try:
-                size = absolute_path.stat().st_size
+                st = os.lstat(path)
+                if stat.S_ISLNK(st.st_mode):
+                    st = os.stat(path)
+                    path = os.path.realpath(path)
             except OSError:
                 continue
-            if size == 0:
-                continue
+            record = make_record(path, name, extension, st)
+            if record is not None:
+                records.append(record)
+        cache.directories[directory] = (now, mtime_ns, allowed_ext, cached[3])
+        return records, subdirs
+
+    listing = list_directory(directory, allowed_ext)
+    if listing is None:
+        # Not cached, so a directory that could not be read is retried next run.
+        return [], []
+    candidates, subdirs = listing
+    names = [(entry.name, extension) for entry, extension in candidates]
+    cache.directories[directory] = (now, mtime_ns, allowed_ext, (names, subdirs))
+    return stat_candidates(candidates), subdirs
 
-            record = FileRecord(
-                path=str(absolute_path.resolve()),
-                name=absolute_path.name,
-                size=size,
-                extension=normalized_ext,
-                category=infer_category(normalized_ext),
-            )
-            records.append(record)
-    return records
 
+def collect_candidates(
+    root: Path,
+    include_ext: Set[str] | None,
+    exclude_ext: Set[str],
+    skip_media: bool = True,
+    threads: int = 1,
+    cache: ScanCache | None = None,
+) -> Iterator[FileRecord]:
+    """Yield matching files under root, one directory's worth at a time."""
+    # Frozen so the filter sets are safe to share with scan threads.
+    include = frozenset(ext.lower() for ext in include_ext) if include_ext else None
+    exclude = frozenset(ext.lower() for ext in exclude_ext)
+    allowed_ext = (include if include is not None else TARGET_EXTENSIONS) - exclude
+    if skip_media:
+        allowed_ext -= MEDIA_EXTENSIONS
+    if cache is None:
+        scan = partial(scan_directory, allowed_ext=allowed_ext)
+    else:
+        scan = partial(cached_scan, allowed_ext=allowed_ext, cache=cache)
+
+    # The walk never follows directory symlinks, so resolving the root once
+    # makes every directory path below it canonical; regular files then only
+    # need their name joined on, and only symlinked files are resolved.
+    root_path = os.path.realpath(root)
+    if threads > 1:
+        # scandir/stat release the GIL, so listing directories concurrently
+        # hides per-call latency on network or deep trees.
+        fetch = scan_parallel(root_path, scan, threads).pop
+    else:
+        fetch = scan
+
+    # Visit directories lowest inode first (inode numbers come free with
+    # getdents), which keeps reads close to on-disk layout on HDDs. Results are
+    # yielded in that same order so deduplication keeps the same first match
+    # regardless of how many threads did the listing.
+    heap: List[Tuple[int, str]] = [(0, root_path)]
+    while heap:
+        _, directory = heapq.heappop(heap)
+        dir_records, subdirs = fetch(directory)
+        yield from dir_records
+        for subdir in subdirs:
+            heapq.heappush(heap, subdir)
+
+
+def file_digest(path: str, size: int, sampled: bool = False) -> bytes | None:
+    """Hash a file's contents, or only its first/middle/last windows when sampled.
+
+    Returns None when the file cannot be read, so callers treat it as unique.
+    """
+    hasher = new_hasher()
+    try:
+        if sampled:
+            with open(path, "rb") as handle:
+                for offset in (0, (size - SAMPLE_WINDOW) // 2, size - SAMPLE_WINDOW):
+                    handle.seek(offset)
+                    hasher.update(handle.read(SAMPLE_WINDOW))
+        elif hasattr(hasher, "update_mmap"):
+            hasher.update_mmap(path)
+        else:
+            with open(path, "rb") as handle:
+                for chunk in iter(partial(handle.read, HASH_CHUNK_SIZE), b""):
+                    hasher.update(chunk)
+    except OSError:
+        return None
+    return hasher.digest()
 
-def deduplicate(records: Iterable[FileRecord]) -> List[FileRecord]:
-    seen_paths: Set[str] = set()
-    name_size_keys: Set[tuple[str, int]] = set()
-    deduped: List[FileRecord] = []
 
+def cached_digest(record: FileRecord, sampled: bool, cache: ScanCache) -> bytes | None:
+    """Reuse a content hash while the file's size and mtime are unchanged."""
+    try:
+        st = os.stat(record.path)
+    except OSError:
+        return None
+    key = (record.path, st.st_size, st.st_mtime_ns, sampled)
+    now = time.time()
+    cached = cache.digests.get(key)
+    if cached is not None and now - cached[0] < SCAN_CACHE_TTL_SECONDS:
+        cache.digests[key] = (now, cached[1])
+        return cached[1]
+    digest = file_digest(record.path, record.size, sampled=sampled)
+    if digest is not None:
+        cache.digests[key] = (now, digest)
+    return digest
+
+
+def group_by_digest(
+    records: Sequence[FileRecord], sampled: bool, cache: ScanCache | None = None
+) -> List[List[FileRecord]]:
+    """Split same-size records into groups with identical (sampled) content hashes."""
+    groups: Dict[bytes, List[FileRecord]] = defaultdict(list)
+    for record in records:
+        if cache is None:
+            digest = file_digest(record.path, record.size, sampled=sampled)
+        else:
+            digest = cached_digest(record, sampled, cache)
+        if digest is not None:
+            groups[digest].append(record)
+    return list(groups.values())
+
+
+def deduplicate(
+    records: Iterable[FileRecord], cache: ScanCache | None = None
+) -> List[FileRecord]:
+    """Drop repeated paths, then files whose contents match an earlier record.
+
+    Records are bucketed by exact size first, so singleton sizes are never
+    read. Buckets of large files are narrowed with a sampled hash before any
+    file is hashed in full.
+    """
+    seen_paths: Set[str] = set()
+    unique: List[FileRecord] = []
+    by_size: Dict[int, List[FileRecord]] = defaultdict(list)
     for record in records:
         path_key = record.path.lower()
-        name_size_key = (record.name.lower(), record.size)
         if path_key in seen_paths:
             continue
-        if name_size_key in name_size_keys:
-            continue
         seen_paths.add(path_key)
-        name_size_keys.add(name_size_key)
-        deduped.append(record)
-    return deduped
+        unique.append(record)
+        by_size[record.size].append(record)
+
+    duplicate_ids: Set[int] = set()
+    for size, bucket in by_size.items():
+        if len(bucket) < 2:
+            continue
+        candidates = [bucket]
+        if size > SAMPLE_THRESHOLD:
+            candidates = group_by_digest(bucket, sampled=True, cache=cache)
+        for group in candidates:
+            if len(group) < 2:
+                continue
+            for matches in group_by_digest(group, sampled=False, cache=cache):
+                # Groups keep scan order, so the first record of each is kept.
+                duplicate_ids.update(id(record) for record in matches[1:])
+    return [record for record in unique if id(record) not in duplicate_ids]
 
 
 def build_summary(records: Sequence[FileRecord]) -> Dict[str, List[str]]:
-    summary: Dict[str, List[str]] = {}
-    for record in records:
-        summary.setdefault(record.category, []).append(record.name)
-    for names in summary.values():
-        names.sort()
-    return dict(sorted(summary.items()))
+    return {
+        category: sorted([record.name for record in items])
+        for category, items in group_by_category(records).items()
+    }
 
 
-def format_text_output(summary: Dict[str, List[str]], records: Sequence[FileRecord]) -> str:
-    lines: List[str] = []
-    total = len(records)
-    lines.append(f"Total files: {total}")
-    lines.append("\nSummary by category:")
+def write_text_output(
+    stream: TextIO, summary: Dict[str, List[str]], records: Sequence[FileRecord]
+) -> None:
+    """Write the concise and detailed listings to stream one line at a time."""
+    stream.write(f"Total files: {len(records)}\n")
+    stream.write("\nSummary by category:\n")
     for category, names in summary.items():
-        lines.append(f"- {category} ({len(names)}):")
+        stream.write(f"- {category} ({len(names)}):\n")
         for name in names:
-            lines.append(f"  • {name}")
+            stream.write(f"  • {name}\n")
+
+    stream.write("\nDetailed files:\n")
+    stream.writelines(
+        f"- {record.category}: {record.name} [{record.extension}] ({record.size} bytes)\n  {record.path}\n"
+        for record in records
+    )
 
-    lines.append("\nDetailed files:")
+
+def write_json_output(
+    stream: TextIO, summary: Dict[str, List[str]], records: Sequence[FileRecord]
+) -> None:
+    """Write the JSON export record by record, matching ``json.dump(..., indent=2)``."""
+    stream.write('{\n  "summary": ')
+    stream.write(json.dumps(summary, indent=2).replace("\n", "\n  "))
+    stream.write(',\n  "files": [')
+    # Records are laid out by hand: json.dumps with indent runs the pure-Python
+    # encoder, while plain string dumps stay on the C fast path.
+    dumps = json.dumps
+    separator = "\n    "
     for record in records:
-        lines.append(
-            f"- {record.category}: {record.name} [{record.extension}] ({record.size} bytes)\n  {record.path}"
+        stream.write(separator)
+        stream.write(
+            f'{{\n      "path": {dumps(record.path)},\n      "name": {dumps(record.name)},'
+            f'\n      "size": {record.size},\n      "extension": {dumps(record.extension)},'
+            f'\n      "category": {dumps(record.category)}\n    }}'
         )
-    return "\n".join(lines)
+        separator = ",\n    "
+    stream.write("\n  ]\n}" if records else "]\n}")
+
+
+def write_json_file(
+    path: Path, summary: Dict[str, List[str]], records: Sequence[FileRecord]
+) -> None:
+    """Write the JSON export, encoding it in one pass with orjson when installed."""
+    if orjson is not None:
+        payload = {"summary": summary, "files": [record.to_dict() for record in records]}
+        try:
+            data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            # orjson rejects file names holding undecodable bytes (surrogate
+            # escapes); the standard library escapes them instead.
+            pass
+        else:
+            path.write_bytes(data)
+            return
+    with path.open("w", encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE) as f:
+        write_json_output(f, summary, records)
 
 
 def group_by_category(records: Sequence[FileRecord]) -> Dict[str, List[FileRecord]]:
-    grouped: Dict[str, List[FileRecord]] = {}
+    grouped: Dict[str, List[FileRecord]] = defaultdict(list)
     for record in records:
-        grouped.setdefault(record.category, []).append(record)
-    return dict(sorted(grouped.items()))
+        grouped[record.category].append(record)
+    return {category: grouped[category] for category in sorted(grouped)}
 
 
-def print_category_table(records: Sequence[FileRecord]) -> None:
-    grouped = group_by_category(records)
+def print_category_table(grouped: Dict[str, List[FileRecord]]) -> None:
     print("\nCurrent categories and entries:")
-    for category, items in grouped.items():
+    for category in sorted(grouped):
+        items = grouped[category]
         print(f"- {category} ({len(items)} files)")
         for idx, record in enumerate(items, start=1):
             print(f"  [{idx}] {record.name}")
@@ -278,21 +720,34 @@ def prompt_confirmation(message: str) -> bool:
     return response in {"y", "yes"}
 
 
-def match_pattern(name: str, pattern: str, use_regex: bool) -> bool:
+def compile_pattern(pattern: str, use_regex: bool) -> Callable[[str], object] | None:
+    """Build a name matcher once per bulk selection; None for an invalid regex."""
     if use_regex:
         try:
-            return bool(re.search(pattern, name, flags=re.IGNORECASE))
+            regex = re.compile(pattern, flags=re.IGNORECASE)
         except re.error:
             print("  Invalid regex pattern; no matches applied.")
-            return False
-    normalized_pattern = pattern.lower()
-    return fnmatchcase(name.lower(), normalized_pattern)
+            return None
+        return regex.search
+    wildcard = re.compile(translate(pattern.lower()))
+    return lambda name: wildcard.match(name.lower())
 
 
 def organize_categories(records: Sequence[FileRecord], assume_yes: bool) -> List[FileRecord]:
     editable = list(records)
     if not editable:
         return editable
+    # Category index kept in step with every edit so the menu never rescans
+    # the full record list.
+    index: Dict[str, List[FileRecord]] = defaultdict(list, group_by_category(editable))
+    # Entries merged into a category are kept in scan order, so the table's
+    # entry numbers follow the same order they had before any edits.
+    scan_order = {id(record): rank for rank, record in enumerate(editable)}
+
+    def add_to_category(category: str, additions: List[FileRecord]) -> None:
+        items = index[category]
+        items.extend(additions)
+        items.sort(key=lambda record: scan_order[id(record)])
 
     print("\nReview stage: reorganize categories before any copying.")
     print(
@@ -303,7 +758,7 @@ def organize_categories(records: Sequence[FileRecord], assume_yes: bool) -> List
     )
 
     while True:
-        print_category_table(editable)
+        print_category_table(index)
         print(
             "\nOptions:\n"
             "  1) Rename a category\n"
@@ -318,49 +773,49 @@ def organize_categories(records: Sequence[FileRecord], assume_yes: bool) -> List
 
         if choice == "1":
             current = prompt_string("Enter the category to rename: ")
-            if current not in {r.category for r in editable}:
+            if current not in index:
                 print("  Category not found.")
                 continue
-            new_name = prompt_string("Enter the new category name: ")
+            new_name = sys.intern(prompt_string("Enter the new category name: "))
             if not new_name:
                 print("  No name provided.")
                 continue
             if not confirm_action(f"Rename category '{current}' to '{new_name}'?", assume_yes):
                 print("  Rename cancelled.")
                 continue
-            for record in editable:
-                if record.category == current:
-                    record.category = new_name
+            renamed = index.pop(current)
+            for record in renamed:
+                record.category = new_name
+            add_to_category(new_name, renamed)
             print(f"  Renamed '{current}' to '{new_name}'.")
 
         elif choice == "2":
             target = prompt_string("Enter the category to remove: ")
-            if target not in {r.category for r in editable}:
+            if target not in index:
                 print("  Category not found.")
                 continue
             if not confirm_action(f"Remove category '{target}' and all its entries?", assume_yes):
                 print("  Removal cancelled.")
                 continue
-            editable = [r for r in editable if r.category != target]
+            del index[target]
             print(f"  Removed category '{target}'.")
 
         elif choice == "3":
             category = prompt_string("Enter the category of the entry to move: ")
-            grouped = group_by_category(editable)
-            if category not in grouped:
+            if category not in index:
                 print("  Category not found.")
                 continue
             try:
-                index = int(prompt_string("Enter the entry number to move (see table): "))
+                position = int(prompt_string("Enter the entry number to move (see table): "))
             except ValueError:
                 print("  Invalid number.")
                 continue
-            items = grouped[category]
-            if not (1 <= index <= len(items)):
+            items = index[category]
+            if not (1 <= position <= len(items)):
                 print("  Entry number out of range.")
                 continue
-            record = items[index - 1]
-            new_category = prompt_string("Enter the destination category name: ")
+            record = items[position - 1]
+            new_category = sys.intern(prompt_string("Enter the destination category name: "))
             if not new_category:
                 print("  No destination provided.")
                 continue
@@ -370,35 +825,39 @@ def organize_categories(records: Sequence[FileRecord], assume_yes: bool) -> List
             if not confirm_action(message, assume_yes):
                 print("  Move cancelled.")
                 continue
+            del items[position - 1]
+            if not items:
+                del index[category]
             record.category = new_category
+            add_to_category(new_category, [record])
             print(f"  Moved '{record.name}' to '{new_category}'.")
 
         elif choice == "4":
             category = prompt_string("Enter the category of the entry to remove: ")
-            grouped = group_by_category(editable)
-            if category not in grouped:
+            if category not in index:
                 print("  Category not found.")
                 continue
             try:
-                index = int(prompt_string("Enter the entry number to remove (see table): "))
+                position = int(prompt_string("Enter the entry number to remove (see table): "))
             except ValueError:
                 print("  Invalid number.")
                 continue
-            items = grouped[category]
-            if not (1 <= index <= len(items)):
+            items = index[category]
+            if not (1 <= position <= len(items)):
                 print("  Entry number out of range.")
                 continue
-            record = items[index - 1]
+            record = items[position - 1]
             if not confirm_action(f"Remove '{record.name}' from the list?", assume_yes):
                 print("  Removal cancelled.")
                 continue
-            editable.remove(record)
+            del items[position - 1]
+            if not items:
+                del index[category]
             print(f"  Removed '{record.name}'.")
 
         elif choice == "5":
             category = prompt_string("Enter the category to search within: ")
-            grouped = group_by_category(editable)
-            if category not in grouped:
+            if category not in index:
                 print("  Category not found.")
                 continue
             pattern = prompt_string(
@@ -408,10 +867,10 @@ def organize_categories(records: Sequence[FileRecord], assume_yes: bool) -> List
                 print("  No pattern provided.")
                 continue
             use_regex = prompt_yes_no("Treat pattern as regex?", default_no=True)
-            matches = [
-                record for record in grouped[category]
-                if match_pattern(record.name, pattern, use_regex)
-            ]
+            matcher = compile_pattern(pattern, use_regex)
+            if matcher is None:
+                continue
+            matches = [record for record in index[category] if matcher(record.name)]
             if not matches:
                 print("  No entries matched that pattern.")
                 continue
@@ -419,6 +878,8 @@ def organize_categories(records: Sequence[FileRecord], assume_yes: bool) -> List
             for record in matches:
                 print(f"  - {record.name}")
 
+            matched_ids = {id(record) for record in matches}
+            remaining = [r for r in index[category] if id(r) not in matched_ids]
             action = prompt_string(
                 "Choose action for all matches: [move/remove/cancel]: "
             ).lower()
@@ -432,11 +893,14 @@ def organize_categories(records: Sequence[FileRecord], assume_yes: bool) -> List
                 ):
                     print("  Removal cancelled.")
                     continue
-                editable = [r for r in editable if r not in matches]
+                if remaining:
+                    index[category] = remaining
+                else:
+                    del index[category]
                 print(f"  Removed {len(matches)} entr{'y' if len(matches)==1 else 'ies'}.")
                 continue
 
-            destination = prompt_string("Enter the destination category: ")
+            destination = sys.intern(prompt_string("Enter the destination category: "))
             if not destination:
                 print("  No destination provided.")
                 continue
@@ -445,8 +909,13 @@ def organize_categories(records: Sequence[FileRecord], assume_yes: bool) -> List
             ):
                 print("  Move cancelled.")
                 continue
+            if remaining:
+                index[category] = remaining
+            else:
+                del index[category]
             for record in matches:
                 record.category = destination
+            add_to_category(destination, matches)
             print(
                 f"  Moved {len(matches)} entr{'y' if len(matches)==1 else 'ies'} to '{destination}'."
             )
@@ -460,7 +929,8 @@ def organize_categories(records: Sequence[FileRecord], assume_yes: bool) -> List
         else:
             print("  Invalid option. Please choose 1-6.")
 
-    return editable
+    kept_ids = {id(record) for items in index.values() for record in items}
+    return [record for record in editable if id(record) in kept_ids]
 
 
 def export_results(
@@ -477,9 +947,9 @@ def export_results(
         f"- Text: {text_path if text_path else 'none'}",
         f"Total records: {len(records)}",
         "\nPreview (concise and detailed):",
-        format_text_output(summary, records),
     ]
     print("\n".join(preview_message))
+    write_text_output(sys.stdout, summary, records)
 
     if not apply_changes:
         print("Dry-run mode: no files were written. Re-run with --apply to export.")
@@ -491,21 +961,13 @@ def export_results(
 
     if json_path:
         json_path.parent.mkdir(parents=True, exist_ok=True)
-        with json_path.open("w", encoding="utf-8") as f:
-            json.dump(
-                {
-                    "summary": summary,
-                    "files": [record.to_dict() for record in records],
-                },
-                f,
-                indent=2,
-            )
+        write_json_file(json_path, summary, records)
         print(f"Wrote JSON results to {json_path}")
 
     if text_path:
         text_path.parent.mkdir(parents=True, exist_ok=True)
-        with text_path.open("w", encoding="utf-8") as f:
-            f.write(format_text_output(summary, records))
+        with text_path.open("w", encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE) as f:
+            write_text_output(f, summary, records)
         print(f"Wrote text results to {text_path}")
 
 
@@ -571,6 +1033,23 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Launch the guided wizard even when CLI arguments are provided.",
     )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=DEFAULT_SCAN_THREADS,
+        help=f"Directory listing threads for the scan (default: {DEFAULT_SCAN_THREADS}; 1 scans serially).",
+    )
+    parser.add_argument(
+        "--scan-cache",
+        type=Path,
+        nargs="?",
+        const=SCAN_CACHE_PATH,
+        default=None,
+        help=(
+            "Reuse and update a scan cache so unchanged directories are not re-listed "
+            f"and unchanged files are not re-hashed (default path: {SCAN_CACHE_PATH})."
+        ),
+    )
     return parser.parse_args()
 
 
@@ -617,46 +1096,125 @@ def dry_run_category_copy(category: str, records: Sequence[FileRecord], copy_des
     if not records:
         print("  No files to copy.")
         return
+    prefix = os.path.join(dest_dir, "")
     for record in records:
-        destination = dest_dir / record.name
-        print(f"  PLAN: copy {record.path} -> {destination}")
+        print(f"  PLAN: copy {record.path} -> {prefix + record.name}")
 
 
-def write_copy_log(log_path: Path, entries: List[str]) -> None:
-    if not entries:
-        return
-    timestamp = datetime.utcnow().isoformat() + "Z"
-    log_path.parent.mkdir(parents=True, exist_ok=True)
-    with log_path.open("a", encoding="utf-8") as log_file:
-        log_file.write(f"\n# Copy session {timestamp}\n")
-        for line in entries:
-            log_file.write(line + "\n")
+def reflink(src_fd: int, dst_fd: int) -> bool:
+    """Clone src into dst with the FICLONE ioctl; False if the filesystem can't."""
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return False
+    try:
+        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+    except OSError:
+        return False
+    return True
+
+
+def fast_copy(source: str | Path, destination: str | Path, preserve_metadata: bool = True) -> None:
+    """Copy file contents in-kernel where possible, then optionally its metadata.
+
+    A reflink makes the copy near-instant on copy-on-write filesystems (btrfs,
+    XFS). Otherwise ``os.copy_file_range`` keeps the copy in the kernel, and
+    anything it cannot handle falls back to ``shutil.copyfile``, which itself
+    uses sendfile/fcopyfile where available.
+
+    The destination is created exclusively, so an existing file is never
+    overwritten: ``FileExistsError`` is raised instead.
+    """
+    copy_file_range = getattr(os, "copy_file_range", None)
+    with open(source, "rb") as src, open(destination, "xb") as dst:
+        src_fd, dst_fd = src.fileno(), dst.fileno()
+        copied = reflink(src_fd, dst_fd)
+        if not copied and copy_file_range is not None:
+            try:
+                size = os.fstat(src_fd).st_size
+                count = max(size, 1 << 20)
+                total = 0
+                while True:
+                    written = copy_file_range(src_fd, dst_fd, count)
+                    if not written:
+                        break
+                    total += written
+                # Some kernels/filesystems return 0 before end of file; treat a
+                # short copy as unsupported rather than logging it as copied.
+                copied = total == size
+            except OSError:
+                copied = False
+    if not copied:
+        # The destination was created above, so overwriting it here is safe.
+        shutil.copyfile(source, destination)
+    if preserve_metadata:
+        shutil.copystat(source, destination)
+
+
+@dataclass
+class CopyLog:
+    """Copy session log, opened and headed with a timestamp on its first write."""
+
+    path: Path
+    handle: TextIO | None = None
+
+    def write(self, line: str) -> None:
+        if self.handle is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Line-buffered so the log stays readable if a copy run is interrupted.
+            self.handle = self.path.open("a", encoding="utf-8", buffering=1)
+            timestamp = datetime.utcnow().isoformat() + "Z"
+            self.handle.write(f"\n# Copy session {timestamp}\n")
+        self.handle.write(line)
+
+    def close(self) -> None:
+        if self.handle is not None:
+            self.handle.close()
+            self.handle = None
 
 
 def execute_category_copy(
     category: str,
     records: Sequence[FileRecord],
     copy_dest: Path,
-    log_path: Path,
+    log_file: CopyLog,
 ) -> None:
     dest_dir = copy_dest / category
     dest_dir.mkdir(parents=True, exist_ok=True)
-    log_entries: List[str] = []
-    for record in records:
-        source_path = Path(record.path)
-        destination = dest_dir / record.name
-        if destination.exists():
-            print(f"  SKIP: destination already exists, leaving untouched -> {destination}")
-            log_entries.append(f"SKIP existing {destination} (source {source_path})")
-            continue
-        try:
-            shutil.copy2(source_path, destination)
-            print(f"  COPIED: {source_path} -> {destination}")
-            log_entries.append(f"COPIED {source_path} -> {destination}")
-        except OSError as exc:
-            print(f"  ERROR: failed to copy {source_path} -> {destination}: {exc}")
-            log_entries.append(f"ERROR {source_path} -> {destination}: {exc}")
-    write_copy_log(log_path, log_entries)
+    # Plain string joins: building a Path per file is pure overhead here.
+    prefix = os.path.join(dest_dir, "")
+    # fast_copy spends its time in syscalls that release the GIL, so keeping
+    # several copies in flight overlaps their I/O. Results are reported in
+    # record order once each copy finishes.
+    claimed: Set[str] = set()
+    planned: List[Tuple[str, str, Future | None]] = []
+    with ThreadPoolExecutor(max_workers=COPY_THREADS) as executor:
+        for record in records:
+            source_path = record.path
+            destination = prefix + record.name
+            # Only the first record for a name is copied, as when copies ran one
+            # at a time; names are case-folded so case-insensitive filesystems
+            # behave the same. fast_copy still creates the destination
+            # exclusively in case another process made it meanwhile.
+            key = record.name.casefold()
+            if key in claimed:
+                planned.append((source_path, destination, None))
+                continue
+            claimed.add(key)
+            future = executor.submit(fast_copy, source_path, destination)
+            planned.append((source_path, destination, future))
+
+        for source_path, destination, future in planned:
+            try:
+                if future is None:
+                    raise FileExistsError(destination)
+                future.result()
+                print(f"  COPIED: {source_path} -> {destination}")
+                log_file.write(f"COPIED {source_path} -> {destination}\n")
+            except FileExistsError:
+                print(f"  SKIP: destination already exists, leaving untouched -> {destination}")
+                log_file.write(f"SKIP existing {destination} (source {source_path})\n")
+            except OSError as exc:
+                print(f"  ERROR: failed to copy {source_path} -> {destination}: {exc}")
+                log_file.write(f"ERROR {source_path} -> {destination}: {exc}\n")
 
 
 def staged_copy_workflow(
@@ -689,22 +1247,28 @@ def staged_copy_workflow(
         print("Copy workflow skipped by user.")
         return
 
-    for category, items in grouped.items():
-        print(f"\nCategory: {category} ({len(items)} files)")
-        if not assume_yes and not prompt_confirmation(
-            f"Handle category '{category}' with a dry run?"
-        ):
-            print("  Skipped.")
-            continue
-        dry_run_category_copy(category, items, dest)
+    # Keep the log open for the whole session rather than reopening it for
+    # every category; it is only created once there is something to record.
+    copy_log = CopyLog(log_file)
+    try:
+        for category, items in grouped.items():
+            print(f"\nCategory: {category} ({len(items)} files)")
+            if not assume_yes and not prompt_confirmation(
+                f"Handle category '{category}' with a dry run?"
+            ):
+                print("  Skipped.")
+                continue
+            dry_run_category_copy(category, items, dest)
 
-        if not assume_yes and not prompt_confirmation(
-            f"Proceed to copy category '{category}' to {dest}?"
-        ):
-            print("  Copy skipped after dry run.")
-            continue
-        execute_category_copy(category, items, dest, log_file)
-        print(f"  Completed copying category '{category}'.")
+            if not assume_yes and not prompt_confirmation(
+                f"Proceed to copy category '{category}' to {dest}?"
+            ):
+                print("  Copy skipped after dry run.")
+                continue
+            execute_category_copy(category, items, dest, copy_log)
+            print(f"  Completed copying category '{category}'.")
+    finally:
+        copy_log.close()
 
 
 def run_scan_pipeline(
@@ -718,6 +1282,8 @@ def run_scan_pipeline(
     assume_yes: bool,
     copy_dest: Path | None,
     copy_log: Path | None,
+    threads: int = DEFAULT_SCAN_THREADS,
+    scan_cache: Path | None = None,
 ) -> None:
     if not root.exists():
         print(f"Error: root path does not exist: {root}")
@@ -726,32 +1292,40 @@ def run_scan_pipeline(
         print(f"Error: root path is not a directory: {root}")
         return
 
-    records = collect_candidates(
-        root=root,
-        include_ext=include_ext,
-        exclude_ext=exclude_ext,
-        skip_media=not allow_media,
+    # The candidate list only holds references to the records deduplication
+    # keeps, and its length reports how many duplicates were dropped.
+    cache = load_scan_cache(scan_cache) if scan_cache else None
+    candidates = list(
+        collect_candidates(
+            root=root,
+            include_ext=include_ext,
+            exclude_ext=exclude_ext,
+            skip_media=not allow_media,
+            threads=threads,
+            cache=cache,
+        )
     )
-    deduped_records = deduplicate(records)
-
-    print(f"Discovered {len(records)} candidates; {len(deduped_records)} after deduplication.")
-    if not deduped_records:
+    records = deduplicate(candidates, cache=cache)
+    if cache is not None and scan_cache:
+        save_scan_cache(cache, scan_cache)
+    print(f"Discovered {len(candidates)} candidates; {len(records)} after deduplication.")
+    if not records:
         print("No matching files found.")
 
     export_results(
-        records=deduped_records,
+        records=records,
         json_path=output_json,
         text_path=output_text,
         apply_changes=apply_changes,
         assume_yes=assume_yes,
     )
 
-    organized_records = deduped_records
-    if deduped_records:
+    organized_records = records
+    if records:
         if confirm_action(
             "Enter category organization stage before copying?", assume_yes=assume_yes
         ):
-            organized_records = organize_categories(deduped_records, assume_yes=assume_yes)
+            organized_records = organize_categories(records, assume_yes=assume_yes)
         else:
             print("Skipping organization stage; using current categories as-is.")
 
@@ -823,6 +1397,8 @@ def interactive_wizard(args: argparse.Namespace) -> None:
         assume_yes=False,
         copy_dest=copy_destination,
         copy_log=args.copy_log,
+        threads=args.threads,
+        scan_cache=args.scan_cache,
     )
 
 
@@ -849,6 +1425,8 @@ def main() -> None:
         assume_yes=args.yes,
         copy_dest=copy_destination,
         copy_log=args.copy_log,
+        threads=args.threads,
+        scan_cache=args.scan_cache,
     )
 
 
@@ -2,12 +2,16 @@
 
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 import pypdf
 from docx import Document
 import mammoth
 
+# Pages handed to each worker process when extracting PDF text
+PAGES_PER_TASK = 8
+
 def get_unique_output_name(extension):
     """Generate a unique output filename based on timestamp."""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -17,28 +21,16 @@ def merge_pdfs(pdf_files):
     """Merge PDF files with a blank page separator."""
     merger = pypdf.PdfWriter()
     
-    # Create a blank page for separation
-    blank_pdf = pypdf.PdfWriter()
-    blank_pdf.add_blank_page(width=612, height=792)  # Standard letter size
-    blank_path = "temp_blank.pdf"
-    with open(blank_path, "wb") as temp_file:
-        blank_pdf.write(temp_file)
-    
-    # Merge PDFs with separator
+    # Merge PDFs, adding the separator page directly instead of via a temp file
     for pdf_file in pdf_files:
-        reader = pypdf.PdfReader(pdf_file)
-        for page in reader.pages:
-            merger.add_page(page)
-        # Add separator page
-        blank_reader = pypdf.PdfReader(blank_path)
-        merger.add_page(blank_reader.pages[0])
+        reader = pypdf.PdfReader(pdf_file, strict=False)
+        merger.append_pages_from_reader(reader)
+        merger.add_blank_page(width=612, height=792)  # Standard letter size
     
     output_name = get_unique_output_name(".pdf")
     with open(output_name, "wb") as output_file:
         merger.write(output_file)
     
-    # Clean up temporary file
-    os.remove(blank_path)
     return output_name
 
 def convert_docx_to_text(docx_path):
@@ -46,33 +38,51 @@ def convert_docx_to_text(docx_path):
     doc = Document(docx_path)
     return "\n\n".join([paragraph.text for paragraph in doc.paragraphs])
 
+def extract_page_range(pdf_path, start, stop):
+    """Extract text from pages [start, stop) of a PDF (runs in a worker process)."""
+    reader = pypdf.PdfReader(pdf_path)
+    return [reader.pages[index].extract_text() for index in range(start, stop)]
+
+def extract_pdf_text(pdf_path, executor):
+    """Extract text from every page of a PDF, spreading page ranges across processes."""
+    pdf_reader = pypdf.PdfReader(pdf_path)
+    page_count = len(pdf_reader.pages)
+    if page_count <= PAGES_PER_TASK:
+        return [page.extract_text() for page in pdf_reader.pages]
+    
+    # Each worker reopens the file once and extracts a contiguous range of pages
+    futures = [
+        executor.submit(extract_page_range, pdf_path, start, min(start + PAGES_PER_TASK, page_count))
+        for start in range(0, page_count, PAGES_PER_TASK)
+    ]
+    return [text for future in futures for text in future.result()]
+
 def merge_to_docx(input_files):
     """Merge various documents into a single DOCX with separators."""
     doc = Document()
     
-    for i, file_path in enumerate(input_files):
-        if i > 0:  # Add separator before each file except the first
-            doc.add_paragraph("=" * 80)  # Horizontal rule
-            doc.add_page_break()
-        
-        file_ext = Path(file_path).suffix.lower()
-        
-        if file_ext == '.pdf':
-            # Extract text from PDF
-            pdf_reader = pypdf.PdfReader(file_path)
-            text = "\n\n".join(page.extract_text() for page in pdf_reader.pages)
-            doc.add_paragraph(text)
+    with ProcessPoolExecutor() as executor:
+        for i, file_path in enumerate(input_files):
+            if i > 0:  # Add separator before each file except the first
+                doc.add_paragraph("=" * 80)  # Horizontal rule
+                doc.add_page_break()
+            
+            file_ext = Path(file_path).suffix.lower()
             
-        elif file_ext == '.docx':
-            # Copy content from DOCX
-            src_doc = Document(file_path)
-            for element in src_doc.element.body:
-                doc.element.body.append(element)
+            if file_ext == '.pdf':
+                # Extract text from PDF
+                text = "\n\n".join(extract_pdf_text(file_path, executor))
+                doc.add_paragraph(text)
                 
-        elif file_ext == '.txt':
-            # Add text file content
-            with open(file_path, 'r', encoding='utf-8') as txt_file:
-                doc.add_paragraph(txt_file.read())
+            elif file_ext == '.docx':
+                # Copy content from DOCX in one batched lxml extend
+                src_doc = Document(file_path)
+                doc.element.body.extend(list(src_doc.element.body))
+                    
+            elif file_ext == '.txt':
+                # Add text file content
+                with open(file_path, 'r', encoding='utf-8') as txt_file:
+                    doc.add_paragraph(txt_file.read())
     
     output_name = get_unique_output_name(".docx")
     doc.save(output_name)
@@ -9,9 +9,11 @@ Running the script will delete and recreate both locations so tests start clean.
 """
 from __future__ import annotations
 
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable, Tuple
+from typing import Iterable, List, Tuple
 
 BASE_DIR = Path(__file__).resolve().parent.parent / "test_data"
 SOURCE_DIR = BASE_DIR / "library_source"
@@ -75,7 +77,6 @@ def reset_directory(path: Path) -> None:
 
 
 def write_file(path: Path, content: str | None) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
     if content is None:
         path.touch()
     else:
@@ -83,34 +84,45 @@ def write_file(path: Path, content: str | None) -> None:
 
 
 def populate_files() -> None:
-    for category in CATEGORIES:
-        (SOURCE_DIR / category).mkdir(parents=True, exist_ok=True)
-
-    for category, filename, content in TARGET_FILES:
-        write_file(SOURCE_DIR / category / filename, content)
-
+    files: List[Tuple[Path, str | None]] = []
+    for relative_dir, filename, content in TARGET_FILES:
+        files.append((SOURCE_DIR / relative_dir / filename, content))
     for relative_dir, filename, content in EDGE_CASE_FILES:
-        write_file(SOURCE_DIR / relative_dir / filename, content)
-
+        files.append((SOURCE_DIR / relative_dir / filename, content))
     for relative_dir, filename, content in DUPLICATE_FILES:
-        write_file(SOURCE_DIR / relative_dir / filename, content)
-
+        files.append((SOURCE_DIR / relative_dir / filename, content))
     for relative_dir, filename, content in NESTED_TARGETS:
-        write_file(SOURCE_DIR / relative_dir / filename, content)
-
+        files.append((SOURCE_DIR / relative_dir / filename, content))
     # Extra uppercase extension to validate normalization.
-    write_file(SOURCE_DIR / "Cookbooks" / "baking_GUIDE.TXT", "Uppercase extension")
+    files.append((SOURCE_DIR / "Cookbooks" / "baking_GUIDE.TXT", "Uppercase extension"))
+
+    # Create each directory once up front so the writes below can run concurrently.
+    directories = {SOURCE_DIR / category for category in CATEGORIES}
+    directories.update(path.parent for path, _ in files)
+    for directory in directories:
+        directory.mkdir(parents=True, exist_ok=True)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda item: write_file(*item), files))
+
+
+def print_files(directory: str, relative_dir: str = "") -> None:
+    # Sorting each directory's entries and recursing in place yields the same
+    # order as sorting every path globally, without materializing the tree.
+    with os.scandir(directory) as entries:
+        ordered = sorted(entries, key=lambda entry: entry.name)
+    for entry in ordered:
+        relative_path = os.path.join(relative_dir, entry.name) if relative_dir else entry.name
+        if entry.is_dir():
+            print_files(entry.path, relative_path)
+        else:
+            print(f"- {relative_path} ({entry.stat().st_size} bytes)")
 
 
 def summarize_created_files() -> None:
-    created = sorted(SOURCE_DIR.rglob("*"))
     print("Created test dataset at:", SOURCE_DIR)
     print("Destination directory:", DEST_DIR)
-    for item in created:
-        if item.is_dir():
-            continue
-        size = item.stat().st_size
-        print(f"- {item.relative_to(SOURCE_DIR)} ({size} bytes)")
+    print_files(os.fspath(SOURCE_DIR))
 
 
 def main() -> None: